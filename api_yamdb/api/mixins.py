@@ -0,0 +1,91 @@
+import copy
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def get_model_fields(serializer):
+    """Вернуть пары (поле сериализатора, поле модели) для его полей."""
+    model = serializer.Meta.model
+    for field in serializer.fields.values():
+        if field.source == "*" or "." in field.source:
+            continue
+        try:
+            yield field, model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            continue
+
+
+def get_related_lookups(serializer, prefix=""):
+    """Собрать lookups для select_related и prefetch_related по полям."""
+    select_related, prefetch_related = [], []
+    for field, model_field in get_model_fields(serializer):
+        if not model_field.is_relation:
+            continue
+        lookup = prefix + field.source
+        nested = getattr(field, "child", field)
+        if model_field.many_to_many or model_field.one_to_many:
+            prefetch_related.append(lookup)
+            if isinstance(nested, serializers.ModelSerializer):
+                prefetch_related.extend(
+                    sum(get_related_lookups(nested, f"{lookup}__"), [])
+                )
+        else:
+            select_related.append(lookup)
+            if isinstance(nested, serializers.ModelSerializer):
+                nested_select, nested_prefetch = get_related_lookups(
+                    nested, f"{lookup}__"
+                )
+                select_related.extend(nested_select)
+                prefetch_related.extend(nested_prefetch)
+    return select_related, prefetch_related
+
+
+class AutoPrefetchMixin:
+    """Подгружает связи, которые выводит сериализатор представления."""
+
+    _lookups_cache = {}
+
+    def prefetch_serializer_relations(self, queryset):
+        """Добавить в queryset select_related и prefetch_related."""
+        serializer_class = self.get_serializer_class()
+        if serializer_class not in self._lookups_cache:
+            self._lookups_cache[serializer_class] = get_related_lookups(
+                serializer_class()
+            )
+        select_related, prefetch_related = self._lookups_cache[
+            serializer_class
+        ]
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+
+class CachedPermissionsMixin:
+    """Создаёт экземпляры проверок доступа один раз на набор классов."""
+
+    _permissions_cache = {}
+
+    def get_permissions(self):
+        """Вернуть закэшированные экземпляры permission_classes."""
+        permission_classes = tuple(self.permission_classes)
+        if permission_classes not in self._permissions_cache:
+            self._permissions_cache[permission_classes] = tuple(
+                permission() for permission in permission_classes
+            )
+        return self._permissions_cache[permission_classes]
+
+
+class CachedFieldsMixin:
+    """Строит поля сериализатора один раз на класс."""
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        """Вернуть копию закэшированных полей."""
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(self._fields_cache[cls])
@@ -3,7 +3,9 @@ from datetime import datetime
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from api.mixins import CachedFieldsMixin
 from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.ratings import get_ratings
 
 
 YEAR_ERROR = "Недействительный год выпуска!"
@@ -11,7 +13,7 @@ YEAR_ERROR = "Недействительный год выпуска!"
 User = get_user_model()
 
 
-class CategoriesSerializer(serializers.ModelSerializer):
+class CategoriesSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     lookup_field = "slug"
 
     class Meta:
@@ -19,7 +21,7 @@ class CategoriesSerializer(serializers.ModelSerializer):
         exclude = ("id",)
 
 
-class GenresSerializer(serializers.ModelSerializer):
+class GenresSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     lookup_field = "slug"
 
     class Meta:
@@ -27,7 +29,7 @@ class GenresSerializer(serializers.ModelSerializer):
         exclude = ("id",)
 
 
-class TitleSerializer(serializers.ModelSerializer):
+class TitleSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     category = serializers.SlugRelatedField(
         slug_field="slug", queryset=Category.objects.all()
     )
@@ -45,15 +47,29 @@ class TitleSerializer(serializers.ModelSerializer):
         return value
 
 
-class GetTitleSerializer(serializers.ModelSerializer):
+class TitleListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        titles = list(data)
+        ratings = get_ratings([title.pk for title in titles])
+        for title in titles:
+            title.rating = ratings[title.pk]
+        return super().to_representation(titles)
+
+
+class GetTitleSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     category = CategoriesSerializer(read_only=True)
     genre = GenresSerializer(read_only=True, many=True)
-    rating = serializers.IntegerField()
-    rating = serializers.IntegerField()
+    rating = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Title
         fields = "__all__"
+        list_serializer_class = TitleListSerializer
+
+    def to_representation(self, instance):
+        if not hasattr(instance, "rating"):
+            instance.rating = get_ratings([instance.pk])[instance.pk]
+        return super().to_representation(instance)
 
 
 class SignUpSerializer(serializers.ModelSerializer):
@@ -70,7 +86,7 @@ class TokenObtainWithConfirmationSerializer(serializers.Serializer):
     confirmation_code = serializers.CharField()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
@@ -82,8 +98,15 @@ class UserSerializer(serializers.ModelSerializer):
             "role",
         ]
 
+    def update(self, instance, validated_data):
+        """Записать в базу только переданные поля."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=validated_data.keys())
+        return instance
+
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
         slug_field="username",
@@ -94,7 +117,7 @@ class ReviewSerializer(serializers.ModelSerializer):
         exclude = ("title",)
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
         slug_field="username",
@@ -1,11 +1,24 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db import transaction
 from django.utils.crypto import get_random_string
 
 
-def send_confirmation_email(email):
-    """Сгенерировать и отправить случайный код."""
-    confirmation_code = get_random_string(length=6)
+logger = logging.getLogger(__name__)
+
+email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="email")
+
+
+def generate_confirmation_code():
+    """Сгенерировать случайный код подтверждения."""
+    return get_random_string(length=6)
+
+
+def send_confirmation_email(email, confirmation_code):
+    """Отправить код подтверждения на почту."""
     subject = "Confirmation Code"
     message = f"Your confirmation code is: {confirmation_code}"
     from_email = settings.DEFAULT_FROM_EMAIL
@@ -19,4 +32,23 @@ def send_confirmation_email(email):
         recipient_list,
         fail_silently=False,
     )
-    return confirmation_code
+
+
+def send_confirmation_email_logged(email, confirmation_code):
+    """Отправить код, записав в лог ошибку отправки."""
+    try:
+        send_confirmation_email(email, confirmation_code)
+    except Exception:
+        logger.exception("Не удалось отправить код на %s", email)
+
+
+def dispatch_confirmation_email(email, confirmation_code):
+    """Отправить код в фоне после фиксации транзакции."""
+    if not settings.SEND_EMAIL_ASYNC:
+        send_confirmation_email(email, confirmation_code)
+        return
+    transaction.on_commit(
+        lambda: email_executor.submit(
+            send_confirmation_email_logged, email, confirmation_code
+        )
+    )
@@ -1,10 +1,10 @@
 from django.contrib.auth import get_user_model
-from django.core.exceptions import SuspiciousOperation
-from django.db.models import Avg
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import CreateAPIView
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import (
@@ -17,6 +17,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import AccessToken
 
 from api.filters import TitleFilter
+from api.mixins import AutoPrefetchMixin, CachedPermissionsMixin
 from api.permissions import (
     IsAdmin,
     IsAdminOrReadOnly,
@@ -33,14 +34,23 @@ from api.serializers import (
     TokenObtainWithConfirmationSerializer,
     UserSerializer,
 )
-from api.utils import send_confirmation_email
+from api.utils import dispatch_confirmation_email, generate_confirmation_code
 from reviews.models import Category, Genre, Review, Title
 
 
+REVIEW_EXISTS_ERROR = "Вы уже оставили отзыв на это произведение!"
+SIGNUP_CONFLICT_ERROR = "Пользователь с таким username или email уже есть"
+HTTP_METHODS_WITHOUT_PUT = tuple(
+    method
+    for method in viewsets.ModelViewSet.http_method_names
+    if method != "put"
+)
+
 User = get_user_model()
 
 
 class GetPostDeleteViewSet(
+    CachedPermissionsMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     mixins.ListModelMixin,
@@ -71,21 +81,21 @@ class GenresViewSet(GetPostDeleteViewSet):
     permission_classes = (IsAdminOrReadOnly,)
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(
+    AutoPrefetchMixin, CachedPermissionsMixin, viewsets.ModelViewSet
+):
     """Обрабатывает информацию о произведениях."""
 
     filter_backends = (filters.SearchFilter, DjangoFilterBackend)
     search_fields = ("name",)
     permission_classes = (IsAdminOrReadOnly,)
     filterset_class = TitleFilter
-    http_method_names = [
-        m for m in viewsets.ModelViewSet.http_method_names if m not in ["put"]
-    ]
+    http_method_names = HTTP_METHODS_WITHOUT_PUT
 
     def get_queryset(self):
-        """Добавить поле "rating" в queryset."""
-        return Title.objects.annotate(rating=Avg("reviews__score")).order_by(
-            "-year"
+        """Получить произведения; рейтинг берётся из кэша сериализатором."""
+        return self.prefetch_serializer_relations(
+            Title.objects.order_by("-year")
         )
 
     def get_serializer_class(self):
@@ -95,25 +105,25 @@ class TitleViewSet(viewsets.ModelViewSet):
         return TitleSerializer
 
 
-class UsersViewSet(viewsets.ModelViewSet):
+class UsersViewSet(
+    AutoPrefetchMixin, CachedPermissionsMixin, viewsets.ModelViewSet
+):
     """Создаёт новых пользователей."""
 
     serializer_class = UserSerializer
     permission_classes = (IsAdmin,)
+    # Не CursorPagination: ключ "count" в ответе входит в контракт API.
     pagination_class = PageNumberPagination
     lookup_field = "username"
     filter_backends = [filters.SearchFilter]
     search_fields = ["username"]
+    http_method_names = HTTP_METHODS_WITHOUT_PUT
 
     def get_queryset(self):
-        """Получить queryset."""
-        return User.objects.all()
-
-    def update(self, request, *args, **kwargs):
-        """Обновить профиль пользователя."""
-        if request.method == "PUT":
-            return Response(status=status.HTTP_405_METHOD_NOT_ALLOWED)
-        return super().update(request, *args, **kwargs)
+        """Получить queryset только с отдаваемыми полями."""
+        return self.prefetch_serializer_relations(
+            User.objects.only("id", *UserSerializer.Meta.fields)
+        )
 
     @action(
         methods=["GET", "PATCH"],
@@ -155,7 +165,10 @@ class TokenObtainWithConfirmationView(CreateAPIView):
         if username == "me":
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        user = get_object_or_404(User, username=username)
+        user = get_object_or_404(
+            User.objects.only("id", "username", "confirmation_code"),
+            username=username,
+        )
 
         if confirmation_code == user.confirmation_code:
             token = AccessToken.for_user(user)
@@ -182,9 +195,13 @@ class SignupView(APIView):
             )
 
         # Проверить, существует ли пользователь с таким именем пользователя.
-        existing_user = User.objects.filter(username=username).first()
-        if existing_user:
-            if existing_user.email != email:
+        existing_email = (
+            User.objects.filter(username=username)
+            .values_list("email", flat=True)
+            .first()
+        )
+        if existing_email is not None:
+            if existing_email != email:
                 return Response(
                     {
                         "detail": (
@@ -201,13 +218,22 @@ class SignupView(APIView):
 
         serializer = SignUpSerializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
-
-            # Отправить письмо с кодом.
-            confirmation_code = send_confirmation_email(user.email)
+            # Параллельная регистрация с теми же данными упрётся в
+            # уникальные индексы, а не в ошибку сервера.
+            confirmation_code = generate_confirmation_code()
+            try:
+                with transaction.atomic():
+                    user = serializer.save(
+                        confirmation_code=confirmation_code
+                    )
+            except IntegrityError:
+                return Response(
+                    {"detail": SIGNUP_CONFLICT_ERROR},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-            user.confirmation_code = confirmation_code
-            user.save()
+            # Отправить письмо с кодом, не дожидаясь SMTP.
+            dispatch_confirmation_email(user.email, confirmation_code)
 
             return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -215,7 +241,9 @@ class SignupView(APIView):
         return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(
+    AutoPrefetchMixin, CachedPermissionsMixin, viewsets.ModelViewSet
+):
     """Обрабатывает информацию об отзывах."""
 
     serializer_class = ReviewSerializer
@@ -223,38 +251,35 @@ class ReviewViewSet(viewsets.ModelViewSet):
         IsAuthenticatedOrReadOnly,
         IsAuthorModerAdminOrReadOnly,
     )
-    http_method_names = [
-        m for m in viewsets.ModelViewSet.http_method_names if m not in ["put"]
-    ]
+    http_method_names = HTTP_METHODS_WITHOUT_PUT
 
     def get_title(self):
-        """Получить произведение."""
-        title = self.kwargs.get("title_id")
-        return get_object_or_404(Title, id=title)
+        """Получить произведение (один раз за запрос)."""
+        if not hasattr(self, "_title"):
+            self._title = get_object_or_404(
+                Title, id=self.kwargs.get("title_id")
+            )
+        return self._title
 
     def get_queryset(self):
         """Вернуть все отзывы к произведению."""
         title = self.get_title()
-        queryset = title.reviews.all()
-        return queryset
+        return self.prefetch_serializer_relations(title.reviews.all())
 
     def perform_create(self, serializer):
         """Добавить автора отзыва и id произведения."""
-        title = self.kwargs.get("title_id")
-        if Review.objects.filter(
-            title=title, author=self.request.user
-        ).exists():
-            raise SuspiciousOperation("Invalid JSON")
-        if serializer.is_valid():
-            serializer.save(
-                author=self.request.user, title=self.get_title()
-            )
-
-    def create(self, request, *args, **kwargs):
-        return super().create(request, *args, **kwargs)
+        try:
+            with transaction.atomic():
+                serializer.save(
+                    author=self.request.user, title=self.get_title()
+                )
+        except IntegrityError:
+            raise ValidationError(REVIEW_EXISTS_ERROR)
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    AutoPrefetchMixin, CachedPermissionsMixin, viewsets.ModelViewSet
+):
     """Обрабатывает информацию о комментариях."""
 
     serializer_class = CommentSerializer
@@ -262,19 +287,20 @@ class CommentViewSet(viewsets.ModelViewSet):
         IsAuthenticatedOrReadOnly,
         IsAuthorModerAdminOrReadOnly,
     )
-    http_method_names = [
-        m for m in viewsets.ModelViewSet.http_method_names if m not in ["put"]
-    ]
+    http_method_names = HTTP_METHODS_WITHOUT_PUT
 
     def get_review(self):
-        """Получить отзыв."""
-        review_id = self.kwargs.get("review_id")
-        return get_object_or_404(Review, id=review_id)
+        """Получить отзыв (один раз за запрос)."""
+        if not hasattr(self, "_review"):
+            self._review = get_object_or_404(
+                Review, id=self.kwargs.get("review_id")
+            )
+        return self._review
 
     def get_queryset(self):
         """Вернуть все комментарии к отзыву."""
         review = self.get_review()
-        return review.comments.all()
+        return self.prefetch_serializer_relations(review.comments.all())
 
     def perform_create(self, serializer):
         """Добавить автора комментария и id отзыва."""
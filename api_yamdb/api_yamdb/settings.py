@@ -77,6 +77,29 @@ DATABASES = {
 }
 
 
+# Cache
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
+
+# Title ratings are cached only in a cache shared by all workers; with a
+# per-process backend every request aggregates reviews in SQL instead.
+RATING_CACHE_ENABLED = CACHES["default"]["BACKEND"] not in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+# Ratings are invalidated after review writes commit. A read that misses
+# the cache before a write commits may still store the old value after
+# the invalidation; the TTL bounds how long it is served.
+RATING_CACHE_TIMEOUT = int(os.getenv("RATING_CACHE_TIMEOUT", 60))
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -111,6 +134,10 @@ EMAIL_HOST_PASSWORD = os.getenv("PASSWORD")
 
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
+# Send confirmation emails from a background thread after commit, so the
+# signup response does not wait for SMTP.
+SEND_EMAIL_ASYNC = True
+
 
 # Internationalization
 
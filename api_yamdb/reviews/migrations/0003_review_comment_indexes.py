@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0002_auto_20240125_1253"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["title", "-pub_date"],
+                name="review_title_pub_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["review_id", "-pub_date"],
+                name="comment_review_pub_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0003_review_comment_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="myuser",
+            constraint=models.CheckConstraint(
+                check=models.Q(role__in=("admin", "moderator", "user")),
+                name="myuser_role_valid",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# Колонки, по которым API ищет через icontains.
+SEARCH_COLUMNS = (
+    ("reviews_category", "name"),
+    ("reviews_genre", "name"),
+    ("reviews_title", "name"),
+    ("reviews_myuser", "username"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Создать GIN-индексы pg_trgm для поиска (только PostgreSQL)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in SEARCH_COLUMNS:
+        # Выражение совпадает с тем, что Django строит для icontains.
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{table}_{column}_trgm" '
+            f'ON "{table}" USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in SEARCH_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_trgm"')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0004_myuser_role_check"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
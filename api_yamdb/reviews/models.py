@@ -7,10 +7,15 @@ from django.db import models
 from reviews.validators import validate_username
 
 
+ROLE_ADMIN = "admin"
+ROLE_MODERATOR = "moderator"
+ROLE_USER = "user"
+
+
 class MyUser(AbstractUser):
-    ADMIN = "admin"
-    MODERATOR = "moderator"
-    USER = "user"
+    ADMIN = ROLE_ADMIN
+    MODERATOR = ROLE_MODERATOR
+    USER = ROLE_USER
 
     ROLE_CHOICES = [
         (ADMIN, "Администратор"),
@@ -34,7 +39,7 @@ class MyUser(AbstractUser):
     )
     role = models.CharField(
         max_length=50,
-        default="user",
+        default=USER,
         choices=ROLE_CHOICES,
     )
     confirmation_code = models.CharField(
@@ -44,17 +49,25 @@ class MyUser(AbstractUser):
 
     class Meta:
         ordering = ("pk",)
+        constraints = (
+            models.CheckConstraint(
+                check=models.Q(
+                    role__in=(ROLE_ADMIN, ROLE_MODERATOR, ROLE_USER)
+                ),
+                name="myuser_role_valid",
+            ),
+        )
 
     def __str__(self):
         return self.username[:15]
 
     @property
     def is_admin(self):
-        return self.role == "admin" or self.is_superuser
+        return self.role == self.ADMIN or self.is_superuser
 
     @property
     def is_moder(self):
-        return self.role == "moderator"
+        return self.role == self.MODERATOR
 
 
 User = get_user_model()
@@ -110,10 +123,7 @@ class Title(models.Model):
         ordering = ("-year",)
 
     def __str__(self):
-        return (
-            f"{self.name[:10]} {self.year} {self.description[:20]}"
-            f"{self.genre} {self.category}"
-        )
+        return f"{self.name[:10]} {self.year}"
 
 
 class GenreTitle(models.Model):
@@ -147,6 +157,11 @@ class Review(models.Model):
                 fields=("title", "author"), name="unique_person"
             ),
         )
+        indexes = (
+            models.Index(
+                fields=("title", "-pub_date"), name="review_title_pub_date_idx"
+            ),
+        )
 
     def __str__(self):
         return f"{self.text[:10]} {self.author} {self.score}"
@@ -170,6 +185,12 @@ class Comment(models.Model):
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
         ordering = ("-pub_date",)
+        indexes = (
+            models.Index(
+                fields=("review_id", "-pub_date"),
+                name="comment_review_pub_date_idx",
+            ),
+        )
 
     def __str__(self):
         return f"{self.text[:10]} {self.author}"
@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg
+
+from reviews.models import Review
+
+
+RATING_CACHE_KEY = "title:rating:{}"
+
+
+def aggregate_ratings(title_ids):
+    """Посчитать рейтинги произведений одним запросом."""
+    ratings = dict.fromkeys(title_ids)
+    ratings.update(
+        Review.objects.filter(title__in=title_ids)
+        .order_by()
+        .values_list("title")
+        .annotate(Avg("score"))
+    )
+    return ratings
+
+
+def get_ratings(title_ids):
+    """Вернуть рейтинги произведений, досчитав недостающие в кэше."""
+    if not settings.RATING_CACHE_ENABLED:
+        return aggregate_ratings(title_ids)
+    keys = {
+        RATING_CACHE_KEY.format(title_id): title_id for title_id in title_ids
+    }
+    ratings = {
+        keys[key]: rating for key, rating in cache.get_many(keys).items()
+    }
+    missing = [title_id for title_id in title_ids if title_id not in ratings]
+    if missing:
+        computed = aggregate_ratings(missing)
+        cache.set_many(
+            {
+                RATING_CACHE_KEY.format(title_id): rating
+                for title_id, rating in computed.items()
+            },
+            timeout=settings.RATING_CACHE_TIMEOUT,
+        )
+        ratings.update(computed)
+    return ratings
+
+
+def delete_rating(title_id):
+    """Удалить рейтинг произведения из кэша."""
+    cache.delete(RATING_CACHE_KEY.format(title_id))
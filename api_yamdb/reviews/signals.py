@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Review, Title
+from reviews.ratings import delete_rating
+
+
+@receiver((post_save, post_delete), sender=Review)
+def review_changed(sender, instance, **kwargs):
+    """Сбросить рейтинг произведения после фиксации изменения отзыва."""
+    title_id = instance.title_id
+    transaction.on_commit(lambda: delete_rating(title_id))
+
+
+@receiver(post_delete, sender=Title)
+def title_deleted(sender, instance, **kwargs):
+    """Убрать рейтинг удалённого произведения из кэша."""
+    title_id = instance.pk
+    transaction.on_commit(lambda: delete_rating(title_id))
@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def send_email_sync(settings):
+    settings.SEND_EMAIL_ASYNC = False
@@ -0,0 +1,131 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+
+from reviews.models import Review
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08RatingCache:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+    RATING_CACHE_KEY = 'title:rating:{}'
+
+    @pytest.fixture(autouse=True)
+    def enable_rating_cache(self, settings):
+        settings.RATING_CACHE_ENABLED = True
+
+    def get_rating(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()['rating']
+
+    def test_01_rating_none_without_reviews(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get('/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        assert [title['rating'] for title in response.json()['results']] == [
+            None, None
+        ]
+        assert cache.get_many(
+            [self.RATING_CACHE_KEY.format(title['id']) for title in titles]
+        ) == {
+            self.RATING_CACHE_KEY.format(title['id']): None
+            for title in titles
+        }
+
+    def test_02_rating_served_from_cache(self, client, admin_client,
+                                         user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'text', 4)
+        assert self.get_rating(client, title_id) == 4
+
+        # Обновление мимо ORM-сигналов не видно, пока запись в кэше жива.
+        Review.objects.filter(title=title_id).update(score=8)
+        assert self.get_rating(client, title_id) == 4
+
+        cache.delete(self.RATING_CACHE_KEY.format(title_id))
+        assert self.get_rating(client, title_id) == 8
+
+    def test_03_rating_invalidated_on_review_changes(
+        self, client, admin_client, user_client, moderator_client
+    ):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        assert self.get_rating(client, title_id) is None
+
+        review = create_single_review(
+            user_client, title_id, 'text', 4
+        ).json()
+        assert self.get_rating(client, title_id) == 4
+
+        create_single_review(moderator_client, title_id, 'text', 8)
+        assert self.get_rating(client, title_id) == 6
+
+        response = user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            ),
+            data={'score': 10}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_rating(client, title_id) == 9
+
+        response = user_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_rating(client, title_id) == 8
+
+    def test_04_rating_dropped_with_title(self, client, admin_client,
+                                          user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'text', 4)
+        assert self.get_rating(client, title_id) == 4
+
+        response = admin_client.delete(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.RATING_CACHE_KEY.format(title_id) not in cache.get_many(
+            [self.RATING_CACHE_KEY.format(title_id)]
+        )
+
+    def test_05_rating_kept_after_rollback(self, client, admin_client,
+                                           user_client, moderator):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'text', 2)
+        assert self.get_rating(client, title_id) == 2
+
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                Review.objects.create(
+                    title_id=title_id, author=moderator, text='text', score=10
+                )
+                raise RuntimeError
+        assert self.get_rating(client, title_id) == 2
+
+    def test_06_rating_not_cached_with_local_cache(self, client, admin_client,
+                                                   user_client, settings):
+        settings.RATING_CACHE_ENABLED = False
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'text', 4)
+        assert self.get_rating(client, title_id) == 4
+        assert cache.get_many([self.RATING_CACHE_KEY.format(title_id)]) == {}
+
+        Review.objects.filter(title=title_id).update(score=8)
+        assert self.get_rating(client, title_id) == 8
@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+
+from api.mixins import AutoPrefetchMixin, get_related_lookups
+from api.serializers import (
+    CommentSerializer, GetTitleSerializer, ReviewSerializer, TitleSerializer,
+    UserSerializer
+)
+from tests.utils import create_single_review, create_titles
+
+
+class Test09AutoPrefetch:
+
+    @pytest.mark.parametrize('serializer_class,expected', [
+        (TitleSerializer, (['category'], ['genre'])),
+        (ReviewSerializer, (['author'], [])),
+        (CommentSerializer, (['author'], [])),
+        (UserSerializer, ([], [])),
+    ])
+    def test_01_related_lookups(self, serializer_class, expected):
+        assert get_related_lookups(serializer_class()) == expected
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_lookups_cached_per_serializer_class(self, client,
+                                                    admin_client):
+        create_titles(admin_client)
+        AutoPrefetchMixin._lookups_cache.clear()
+        response = client.get('/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        cached = dict(AutoPrefetchMixin._lookups_cache)
+        assert cached
+
+        client.get('/api/v1/titles/')
+        assert all(
+            AutoPrefetchMixin._lookups_cache[key] is lookups
+            for key, lookups in cached.items()
+        )
+
+    def test_03_nested_serializer_lookups(self):
+        assert get_related_lookups(GetTitleSerializer()) == (
+            ['category'], ['genre']
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_titles_list_query_count(self, client, admin_client,
+                                        user_client, settings,
+                                        django_assert_num_queries):
+        settings.RATING_CACHE_ENABLED = True
+        titles, _, _ = create_titles(admin_client)
+        for title in titles:
+            create_single_review(user_client, title['id'], 'text', 5)
+
+        # COUNT, произведения с категориями, жанры, рейтинги (промах кэша).
+        with django_assert_num_queries(4):
+            response = client.get('/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()['results']) == len(titles)
+
+        # Рейтинги уже в кэше.
+        with django_assert_num_queries(3):
+            client.get('/api/v1/titles/')
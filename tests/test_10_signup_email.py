@@ -0,0 +1,42 @@
+import threading
+import time
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+
+from api import utils
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10SignupEmail:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    def test_01_email_sent_off_request_path(self, client, settings,
+                                            monkeypatch):
+        settings.SEND_EMAIL_ASYNC = True
+        smtp_released = threading.Event()
+        send_confirmation_email = utils.send_confirmation_email
+
+        def slow_send(email, confirmation_code):
+            smtp_released.wait(timeout=5)
+            send_confirmation_email(email, confirmation_code)
+
+        monkeypatch.setattr(utils, 'send_confirmation_email', slow_send)
+        outbox_before_count = len(mail.outbox)
+
+        response = client.post(
+            self.URL_SIGNUP,
+            data={'email': 'async@yamdb.fake', 'username': 'async_user'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert len(mail.outbox) == outbox_before_count
+
+        smtp_released.set()
+        for _ in range(50):
+            if len(mail.outbox) > outbox_before_count:
+                break
+            time.sleep(0.1)
+        assert len(mail.outbox) == outbox_before_count + 1
+        assert mail.outbox[-1].to == ['async@yamdb.fake']
@@ -0,0 +1,31 @@
+from api.mixins import CachedFieldsMixin
+from api.serializers import GetTitleSerializer
+
+
+class Test11SerializerFieldsCache:
+
+    def test_01_instances_get_independent_bound_fields(self):
+        first = GetTitleSerializer()
+        second = GetTitleSerializer()
+
+        assert first.fields.keys() == second.fields.keys()
+        assert GetTitleSerializer in CachedFieldsMixin._fields_cache
+        for name, field in first.fields.items():
+            assert field is not second.fields[name]
+            assert field.parent is first
+            assert second.fields[name].parent is second
+            assert field.field_name == name
+
+        first_child = first.fields['genre'].child
+        second_child = second.fields['genre'].child
+        assert first_child is not second_child
+        assert first_child.parent is first.fields['genre']
+        assert second_child.parent is second.fields['genre']
+        assert first.fields['category'].fields['slug'] is not (
+            second.fields['category'].fields['slug']
+        )
+
+        for field in CachedFieldsMixin._fields_cache[
+            GetTitleSerializer
+        ].values():
+            assert getattr(field, 'parent', None) is None
@@ -0,0 +1,34 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.permissions import IsAuthenticated
+
+from api.mixins import CachedPermissionsMixin
+from api.permissions import IsAdmin
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12PermissionsCache:
+
+    def test_01_action_permissions_not_shared(self, user_client,
+                                              admin_client):
+        CachedPermissionsMixin._permissions_cache.clear()
+
+        # Сначала закэшировать IsAdmin для списка пользователей.
+        assert admin_client.get('/api/v1/users/').status_code == HTTPStatus.OK
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+
+        # Действие me переопределяет permission_classes на IsAuthenticated.
+        response = user_client.get('/api/v1/users/me/')
+        assert response.status_code == HTTPStatus.OK
+        assert user_client.get('/api/v1/users/').status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+
+        cache = CachedPermissionsMixin._permissions_cache
+        assert [type(p) for p in cache[(IsAdmin,)]] == [IsAdmin]
+        assert [type(p) for p in cache[(IsAuthenticated,)]] == [
+            IsAuthenticated
+        ]
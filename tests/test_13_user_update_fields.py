@@ -0,0 +1,31 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.serializers import UserSerializer
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13UserUpdateFields:
+
+    def get_updates(self, user, data):
+        serializer = UserSerializer(user, data=data, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as context:
+            serializer.save()
+        return [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE')
+        ]
+
+    def test_01_only_submitted_fields_updated(self, user):
+        updates = self.get_updates(user, {'bio': 'new bio'})
+        assert len(updates) == 1
+        set_clause = updates[0].split(' SET ')[1].split(' WHERE ')[0]
+        assert set_clause.count('=') == 1
+        assert '"bio"' in set_clause
+        user.refresh_from_db()
+        assert user.bio == 'new bio'
+
+    def test_02_empty_patch_is_noop(self, user):
+        assert self.get_updates(user, {}) == []